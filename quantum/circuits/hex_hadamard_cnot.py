@@ -8,10 +8,130 @@ in the Nyxora cryptocurrency.
 """
 
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.circuit.library import HGate, CXGate
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
 import hashlib
 import json
+import functools
+import struct
+
+# Import the Aer simulator once at load time; None selects the legacy interface
+try:
+    from qiskit_aer import AerSimulator
+except ImportError:
+    AerSimulator = None
+
+# orjson is optional; it encodes descriptors much faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(obj):
+    """
+    Serialize an object to compact JSON bytes with sorted keys.
+    
+    orjson and the json fallback produce identical output for descriptors,
+    which only contain str keys, lists, ints and floats.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
+
+
+# Corner directions of the six hexagon sides
+HEX_ANGLES = np.arange(6) * np.pi / 3
+HEX_CORNERS = np.stack([np.cos(HEX_ANGLES), np.sin(HEX_ANGLES)], axis=1)
+
+# Direction travelled along each side, per position on that side
+HEX_SIDE_STEPS = np.array([
+    [np.cos(np.pi / 3), np.sin(np.pi / 3)],     # Top-right
+    [1.0, 0.0],                                 # Right
+    [np.cos(-np.pi / 3), np.sin(-np.pi / 3)],   # Bottom-right
+    [-np.cos(np.pi / 3), -np.sin(np.pi / 3)],   # Bottom-left
+    [-1.0, 0.0],                                # Left
+    [-np.cos(np.pi / 3), -np.sin(np.pi / 3)],   # Top-left
+])
+
+
+def _hex_positions_loop(layers):
+    """
+    Compute the x and y coordinates of every qubit in the hexagonal lattice.
+    
+    Written with nopython-friendly primitives only so that it can be compiled
+    with Numba. Index 0 is the center qubit at the origin.
+    
+    Args:
+        layers: Number of hexagonal layers
+    
+    Returns:
+        A tuple of (xs, ys) float64 arrays of length 1 + 3*layers*(layers-1)
+    """
+    count = 1 + 3 * layers * (layers - 1)
+    xs = np.zeros(count)
+    ys = np.zeros(count)
+    
+    qubit_idx = 1
+    for layer in range(1, layers):
+        # Side s starts at the corner layer * HEX_CORNERS[s] and advances by
+        # HEX_SIDE_STEPS[s] for every position along the side
+        for side in range(6):
+            for pos in range(layer):
+                xs[qubit_idx] = layer * HEX_CORNERS[side, 0] + pos * HEX_SIDE_STEPS[side, 0]
+                ys[qubit_idx] = layer * HEX_CORNERS[side, 1] + pos * HEX_SIDE_STEPS[side, 1]
+                qubit_idx += 1
+    
+    return xs, ys
+
+
+def _hex_positions_vectorized(layers):
+    """
+    NumPy equivalent of _hex_positions_loop() used below JIT_MIN_LAYERS or without Numba.
+    """
+    layer_positions = [np.zeros((1, 2))]
+    for layer in range(1, layers):
+        steps = np.arange(layer)[None, :, None] * HEX_SIDE_STEPS[:, None, :]
+        layer_positions.append((layer * HEX_CORNERS[:, None, :] + steps).reshape(-1, 2))
+    
+    positions = np.concatenate(layer_positions)
+    return positions[:, 0].copy(), positions[:, 1].copy()
+
+
+# Lattices with fewer layers are generated faster with NumPy than it takes
+# to import Numba and compile _hex_positions_loop()
+JIT_MIN_LAYERS = 200
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_hex_positions():
+    """
+    Compile _hex_positions_loop() with Numba on first use.
+    
+    Numba is optional and only imported here, so it adds nothing to import
+    time. Returns None when Numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_hex_positions_loop)
+
+
+def _hex_positions(layers):
+    """
+    Compute the hexagonal lattice positions, compiling with Numba only for large lattices.
+    """
+    if layers >= JIT_MIN_LAYERS:
+        jit_hex_positions = _jit_hex_positions()
+        if jit_hex_positions is not None:
+            return jit_hex_positions(layers)
+    return _hex_positions_vectorized(layers)
+
+# ASCII codes of '0' and '1', indexed by bit value
+_BIT_CHARS = np.array([ord('0'), ord('1')], dtype=np.uint8)
+
+# Random generator for outcomes that can be sampled without simulation
+_rng = np.random.default_rng()
 
 
 class HexagonalQuantumCircuit:
@@ -25,29 +145,27 @@ class HexagonalQuantumCircuit:
     - Measurement operations to generate quantum proof artifacts
     """
     
-    def __init__(self, layers=3, qubits_per_side=2):
+    def __init__(self, layers=3):
         """
         Initialize the hexagonal quantum circuit.
         
+        The number of qubits per side grows with the layer index and is fully
+        determined by ``layers``.
+        
         Args:
             layers: Number of hexagonal layers in the circuit
-            qubits_per_side: Number of qubits per side of the hexagon (excluding center)
         """
         self.layers = layers
-        self.qubits_per_side = qubits_per_side
-        self.qubit_count = self._calculate_qubit_count()
         
         # Create quantum and classical registers
         self.qr = QuantumRegister(self.qubit_count, name='q')
         self.cr = ClassicalRegister(self.qubit_count, name='c')
         self.circuit = QuantumCircuit(self.qr, self.cr)
         
-        # Generate the hexagonal structure
-        self.hex_structure = self._generate_hex_structure()
-        
-    def _calculate_qubit_count(self):
+    @functools.cached_property
+    def qubit_count(self):
         """
-        Calculate the total number of qubits needed for the hexagonal structure.
+        Total number of qubits needed for the hexagonal structure.
         
         For a hexagon with n layers:
         - Layer 0 (center): 1 qubit
@@ -60,9 +178,17 @@ class HexagonalQuantumCircuit:
             return 1
         return 1 + 3 * (self.layers - 1) * self.layers
     
-    def _generate_hex_structure(self):
+    @functools.cached_property
+    def hex_positions(self):
         """
-        Generate the hexagonal structure and connections.
+        The x and y coordinates of every qubit as a tuple of float64 arrays.
+        """
+        return _hex_positions(self.layers)
+    
+    @functools.cached_property
+    def hex_structure(self):
+        """
+        The hexagonal structure and connections, generated on first access.
         
         Returns:
             A dictionary with information about qubit positions and connections
@@ -75,38 +201,10 @@ class HexagonalQuantumCircuit:
         # Center qubit at position (0, 0)
         structure['qubit_positions'][0] = (0, 0)
         
-        qubit_idx = 1
-        
-        # Generate positions for each layer
-        for layer in range(1, self.layers):
-            # Each layer forms a hexagon
-            for side in range(6):
-                for pos in range(layer):
-                    # Calculate position based on layer and side
-                    angle = side * np.pi / 3
-                    dx = layer * np.cos(angle)
-                    dy = layer * np.sin(angle)
-                    
-                    # Adjust position based on position along the side
-                    if side == 0:  # Top-right
-                        dx += pos * np.cos(np.pi / 3)
-                        dy += pos * np.sin(np.pi / 3)
-                    elif side == 1:  # Right
-                        dx += pos
-                    elif side == 2:  # Bottom-right
-                        dx += pos * np.cos(-np.pi / 3)
-                        dy += pos * np.sin(-np.pi / 3)
-                    elif side == 3:  # Bottom-left
-                        dx -= pos * np.cos(np.pi / 3)
-                        dy -= pos * np.sin(np.pi / 3)
-                    elif side == 4:  # Left
-                        dx -= pos
-                    elif side == 5:  # Top-left
-                        dx -= pos * np.cos(np.pi / 3)
-                        dy -= pos * np.sin(np.pi / 3)
-                    
-                    structure['qubit_positions'][qubit_idx] = (dx, dy)
-                    qubit_idx += 1
+        xs, ys = self.hex_positions
+        structure['qubit_positions'].update(
+            enumerate(zip(xs[1:].tolist(), ys[1:].tolist()), start=1)
+        )
         
         return structure
     
@@ -118,16 +216,14 @@ class HexagonalQuantumCircuit:
         for layer_idx in range(self.layers):
             # Apply Hadamard gates on odd layers
             if layer_idx % 2 == 0:
-                for qubit_idx in range(self.qubit_count):
-                    self.circuit.h(qubit_idx)
+                self.circuit.h(range(self.qubit_count))
             # Apply CNOT gates on even layers
             else:
                 # Connect qubits based on hexagonal adjacency
                 self._add_cnot_layer(layer_idx)
         
         # Add measurement gates
-        for qubit_idx in range(self.qubit_count):
-            self.circuit.measure(qubit_idx, qubit_idx)
+        self.circuit.measure(range(self.qubit_count), range(self.qubit_count))
     
     def _add_cnot_layer(self, layer_idx):
         """
@@ -135,69 +231,315 @@ class HexagonalQuantumCircuit:
         """
         # For simplicity, we'll connect each qubit to its next neighbor
         # In a real implementation, this would follow the hexagonal adjacency
-        for qubit_idx in range(self.qubit_count - 1):
-            # Connect to the next qubit
-            self.circuit.cx(qubit_idx, qubit_idx + 1)
+        if self.qubit_count < 2:
+            return
+        
+        # cx broadcasts over the paired control/target ranges in a single call
+        self.circuit.cx(range(self.qubit_count - 1), range(1, self.qubit_count))
+    
+    def clone(self):
+        """
+        Return an independent copy of the circuit, e.g. to re-measure it.
+        
+        QuantumCircuit.copy() duplicates the Rust-backed instruction list
+        directly, which is much cheaper than copy.deepcopy() or a QPY
+        serialization round-trip.
+        """
+        return self.circuit.copy()
     
     def get_circuit_descriptor(self):
         """
         Generate a descriptor for the circuit that can be used for verification.
         """
+        structure = self.hex_structure
         descriptor = {
             'qubit_count': self.qubit_count,
             'layers': self.layers,
-            'structure': self.hex_structure,
+            'structure': {
+                # JSON object keys are strings; convert upfront so both encoders agree
+                'qubit_positions': {
+                    str(qubit_idx): list(position)
+                    for qubit_idx, position in structure['qubit_positions'].items()
+                },
+                'connections': structure['connections']
+            },
             'circuit_width': self.circuit.width(),
             'circuit_depth': self.circuit.depth(),
             'gate_counts': dict(self.circuit.count_ops())
         }
-        return json.dumps(descriptor, sort_keys=True)
+        return _dumps(descriptor).decode()
+    
+    @property
+    def _descriptor_bytes(self):
+        """
+        Canonical bytes of the circuit descriptor, hashed into proof artifacts.
+        """
+        return pack_circuit_descriptor(
+            self.qubit_count,
+            self.layers,
+            self.circuit.width(),
+            self.circuit.depth(),
+            dict(self.circuit.count_ops())
+        )
     
     def simulate(self):
         """
         Simulate the quantum circuit and return measurement results.
 
+        Only a single sample is consumed, so one shot is taken and the counts
+        only ever hold that outcome.
+
         Returns:
             A dictionary with measurement results and circuit information
         """
-        # Try to use the newer qiskit interface
-        try:
-            from qiskit import transpile
-            from qiskit_aer import AerSimulator
-            from qiskit.visualization import plot_histogram
-
-            # Create the simulator
-            backend = AerSimulator()
-
-            # Transpile the circuit for the backend
-            transpiled_circuit = transpile(self.circuit, backend)
-
-            # Run the simulation
-            shots = 1024  # Number of simulation runs
-            result = backend.run(transpiled_circuit, shots=shots).result()
-            counts = result.get_counts(transpiled_circuit)
-        except ImportError:
-            # Fallback to older interface if needed
-            from qiskit import Aer, execute
-            backend = Aer.get_backend('qasm_simulator')
-            result = execute(self.circuit, backend, shots=1024).result()
-            counts = result.get_counts(self.circuit)
-
-        # Get the most common result as the measurement
-        most_common_result = max(counts, key=counts.get)
-        measurement_results = [int(bit) for bit in most_common_result]
+        return self.simulate_batch(1)[0]
+    
+    def simulate_batch(self, n):
+        """
+        Simulate the quantum circuit once and derive n independent results.
+        
+        Every shot of a simulator run is an independent sample, so a single run
+        with n shots replaces n separate simulations and pays the backend and
+        transpilation overhead only once.
+        
+        Args:
+            n: Number of results to generate
+        
+        Returns:
+            A list of dictionaries shaped like the result of simulate()
+        """
+        memory = _run_shots(self.circuit, n)
+        return _simulation_results(memory, self.get_circuit_descriptor(), self._descriptor_bytes)
+
+
+# Clifford operations that can be run on the polynomial-time stabilizer method
+CLIFFORD_GATES = {'h', 'cx', 's', 'x', 'y', 'z', 'measure', 'barrier'}
+
+
+def is_clifford_circuit(circuit):
+    """
+    Check whether a circuit only contains Clifford operations.
+    """
+    return all(instruction.operation.name in CLIFFORD_GATES for instruction in circuit.data)
 
-        # Generate a proof artifact (hash of the circuit and results)
-        circuit_descriptor = self.get_circuit_descriptor()
-        proof_input = circuit_descriptor + most_common_result
-        proof_artifact = hashlib.sha256(proof_input.encode()).hexdigest()
 
-        return {
-            'measurement_results': measurement_results,
-            'proof_artifact': proof_artifact,
+def _run_shots(circuit, shots):
+    """
+    Run a circuit on the simulator and return the measured bitstring of every shot.
+    
+    Clifford circuits run as-is on the stabilizer method, which simulates them
+    in polynomial time; anything else is transpiled for the automatic method.
+    """
+    if AerSimulator is None:
+        # Fallback to older interface if needed
+        from qiskit import Aer, execute
+        backend = Aer.get_backend('qasm_simulator')
+        result = execute(circuit, backend, shots=shots, memory=True).result()
+        return result.get_memory(circuit)
+    
+    if is_clifford_circuit(circuit):
+        backend = aer_backend('stabilizer')
+    else:
+        backend = aer_backend('automatic')
+        circuit = transpile(circuit, backend, optimization_level=3)
+    result = backend.run(circuit, shots=shots, memory=True).result()
+    return result.get_memory(circuit)
+
+
+def _simulation_results(memory, circuit_descriptor, descriptor_bytes):
+    """
+    Turn measured bitstrings into simulation results with proof artifacts.
+    
+    Args:
+        memory: Measured bitstrings, one per shot
+        circuit_descriptor: The JSON circuit descriptor
+        descriptor_bytes: Canonical descriptor bytes hashed into the artifacts
+    
+    Returns:
+        A list of dictionaries with measurement results and circuit information
+    """
+    base_hasher = descriptor_hasher(descriptor_bytes)
+    
+    results = []
+    for bitstring in memory:
+        # Generate a proof artifact (hash of the circuit and results)
+        hasher = base_hasher.copy()
+        hasher.update(bitstring.encode('ascii'))
+        results.append({
+            'measurement_results': bitstring_to_array(bitstring),
+            'proof_artifact': hasher.hexdigest(),
             'circuit_descriptor': circuit_descriptor,
-            'counts': counts
-        }
+            'counts': {bitstring: 1}
+        })
+    
+    return results
+
+
+def _simulate_template(layers, n):
+    """
+    Simulate the cached standard circuit for a layer count n times.
+    
+    Construction, transpilation and descriptor generation are all served from
+    the template caches, so only the simulator run is paid per call.
+    """
+    circuit, circuit_descriptor, descriptor_bytes = circuit_template(layers)
+    
+    if layers == 1:
+        # A single layer is a Hadamard on every qubit followed by measurement,
+        # so every outcome is equally likely and can be drawn directly
+        bits = _rng.integers(0, 2, size=(n, circuit.num_qubits), dtype=np.uint8)
+        memory = [row.tobytes().decode('ascii') for row in _BIT_CHARS[bits]]
+    elif AerSimulator is not None:
+        transpiled_circuit = build_transpiled(layers, 'stabilizer')
+        result = aer_backend('stabilizer').run(transpiled_circuit, shots=n, memory=True).result()
+        memory = result.get_memory(transpiled_circuit)
+    else:
+        memory = _run_shots(circuit, n)
+    
+    return _simulation_results(memory, circuit_descriptor, descriptor_bytes)
+
+
+def bitstring_to_array(bitstring):
+    """
+    Convert a measured bitstring such as '0110' into a uint8 array of bits.
+    
+    This is the measurement_results format of every simulation result and proof.
+    """
+    return np.frombuffer(bitstring.encode('ascii'), dtype=np.uint8) - ord('0')
+
+
+def encode_measurement_results(measurement_results):
+    """
+    Encode measured bits as the ASCII bitstring hashed into proof artifacts.
+    
+    Args:
+        measurement_results: A list or uint8 array of 0/1 values
+    
+    Raises:
+        ValueError: If the results are not a flat sequence of 0s and 1s
+    """
+    bits = np.asarray(measurement_results)
+    if bits.ndim != 1 or not np.isin(bits, (0, 1)).all():
+        raise ValueError("Measurement results must be a sequence of 0s and 1s")
+    return _BIT_CHARS[bits.astype(np.uint8)].tobytes()
+
+
+def pack_circuit_descriptor(qubit_count, layers, circuit_width, circuit_depth, gate_counts):
+    """
+    Pack the verified fields of a circuit descriptor into canonical bytes.
+    
+    Layout (little-endian uint32 throughout): qubit_count, layers, circuit_width,
+    circuit_depth and the number of gate types, followed by the name length,
+    UTF-8 name and count of every gate type in sorted name order.
+    
+    Args:
+        qubit_count: Number of qubits in the circuit
+        layers: Number of hexagonal layers in the circuit
+        circuit_width: Total number of qubits and classical bits
+        circuit_depth: Depth of the circuit
+        gate_counts: Mapping of gate name to number of occurrences
+    
+    Returns:
+        The packed descriptor bytes
+    """
+    parts = [struct.pack('<IIIII', qubit_count, layers, circuit_width, circuit_depth, len(gate_counts))]
+    for name in sorted(gate_counts):
+        encoded_name = name.encode('utf-8')
+        parts.append(struct.pack('<I', len(encoded_name)))
+        parts.append(encoded_name)
+        parts.append(struct.pack('<I', gate_counts[name]))
+    return b''.join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def descriptor_bytes_from_json(circuit_descriptor):
+    """
+    Rebuild the canonical descriptor bytes from a JSON circuit descriptor.
+    
+    Args:
+        circuit_descriptor: The JSON circuit descriptor string
+    
+    Raises:
+        ValueError: If the descriptor is malformed or lacks required fields
+    """
+    descriptor = json.loads(circuit_descriptor)
+    try:
+        return pack_circuit_descriptor(
+            descriptor['qubit_count'],
+            descriptor['layers'],
+            descriptor['circuit_width'],
+            descriptor['circuit_depth'],
+            descriptor['gate_counts']
+        )
+    except (KeyError, TypeError, AttributeError, struct.error) as e:
+        raise ValueError(f"Invalid circuit descriptor: {e}") from e
+
+
+@functools.lru_cache(maxsize=256)
+def descriptor_hasher(descriptor_bytes):
+    """
+    Return a SHA-256 hasher primed with canonical circuit descriptor bytes.
+    
+    Proof artifacts hash the descriptor bytes followed by the measured bitstring,
+    so the descriptor prefix is hashed once and the hasher state is reused. The
+    returned hasher is shared: call ``.copy()`` before updating it.
+    
+    Args:
+        descriptor_bytes: Canonical descriptor bytes from pack_circuit_descriptor()
+    """
+    return hashlib.sha256(descriptor_bytes)
+
+
+@functools.lru_cache(maxsize=32)
+def circuit_template(layers):
+    """
+    Build the standard hexagonal circuit once per layer count.
+    
+    The circuit and its descriptor are deterministic in ``layers``, so they are
+    shared between proofs here and in QuantumSimulator. Callers must not mutate
+    the returned circuit; build a HexagonalQuantumCircuit to get one to modify.
+    
+    Args:
+        layers: Number of hexagonal layers in the circuit
+    
+    Returns:
+        A tuple of (circuit, circuit_descriptor, descriptor_bytes)
+    """
+    template = HexagonalQuantumCircuit(layers=layers)
+    template.build_circuit()
+    return template.circuit, template.get_circuit_descriptor(), template._descriptor_bytes
+
+
+@functools.lru_cache(maxsize=32)
+def build_transpiled(layers, backend_id):
+    """
+    Return the standard hexagonal circuit transpiled for an Aer backend.
+    
+    The transpiled circuit is shared between callers and must not be mutated.
+    
+    Args:
+        layers: Number of hexagonal layers in the circuit
+        backend_id: Aer simulation method the circuit is transpiled for
+    """
+    circuit = circuit_template(layers)[0]
+    # The result is cached, so the most thorough optimization is only paid once
+    return transpile(circuit, aer_backend(backend_id), optimization_level=3)
+
+
+@functools.lru_cache(maxsize=None)
+def aer_backend(method):
+    """
+    Return the shared AerSimulator instance for a simulation method.
+    
+    Args:
+        method: Aer simulation method, e.g. 'stabilizer' or 'statevector'
+    
+    Raises:
+        ImportError: If qiskit_aer is not installed
+    """
+    if AerSimulator is None:
+        raise ImportError("qiskit_aer is not available")
+    return AerSimulator(method=method)
 
 
 def generate_quantum_proof(qubit_count, difficulty_level=1):
@@ -211,25 +553,17 @@ def generate_quantum_proof(qubit_count, difficulty_level=1):
     Returns:
         A dictionary containing the quantum proof components
     """
-    # Calculate layers based on qubit_count (approximate)
-    # From the formula: qubit_count = 1 + 3*(layers-1)*layers
-    # We'll approximate: layers ~ sqrt(qubit_count/3)
-    import math
-    estimated_layers = max(1, int(math.sqrt(qubit_count / 3)) + difficulty_level)
-    
-    # Create the hexagonal circuit
-    circuit = HexagonalQuantumCircuit(layers=estimated_layers, qubits_per_side=1)
-    circuit.build_circuit()
-    
-    # Simulate the circuit to get results
-    simulation_result = circuit.simulate()
+    # Simulate the cached hexagonal circuit to get results
+    layers = estimate_layers(qubit_count, difficulty_level)
+    circuit = circuit_template(layers)[0]
+    simulation_result = _simulate_template(layers, 1)[0]
     
     # Create the quantum proof
     quantum_proof = {
         'circuit_descriptor': simulation_result['circuit_descriptor'],
         'measurement_results': simulation_result['measurement_results'],
         'proof_artifact': simulation_result['proof_artifact'],
-        'qubit_count': circuit.qubit_count,
+        'qubit_count': circuit.num_qubits,
         'timestamp': __import__('time').time(),
         'difficulty_level': difficulty_level
     }
@@ -237,12 +571,67 @@ def generate_quantum_proof(qubit_count, difficulty_level=1):
     return quantum_proof
 
 
+def generate_quantum_proofs(qubit_count, n, difficulty_level=1):
+    """
+    Generate a batch of quantum proofs for the PoQ consensus mechanism.
+    
+    The proofs share a single simulator run (see HexagonalQuantumCircuit.simulate_batch),
+    which is considerably cheaper than calling generate_quantum_proof() n times.
+    
+    Args:
+        qubit_count: Number of qubits to use (determines difficulty)
+        n: Number of proofs to generate
+        difficulty_level: Multiplier for computational difficulty
+    
+    Returns:
+        A list of dictionaries containing the quantum proof components
+    """
+    # Simulate the cached hexagonal circuit once for the whole batch
+    layers = estimate_layers(qubit_count, difficulty_level)
+    circuit = circuit_template(layers)[0]
+    simulation_results = _simulate_template(layers, n)
+    
+    import time
+    return [
+        {
+            'circuit_descriptor': simulation_result['circuit_descriptor'],
+            'measurement_results': simulation_result['measurement_results'],
+            'proof_artifact': simulation_result['proof_artifact'],
+            'qubit_count': circuit.num_qubits,
+            'timestamp': time.time(),
+            'difficulty_level': difficulty_level
+        }
+        for simulation_result in simulation_results
+    ]
+
+
+def estimate_layers(qubit_count, difficulty_level):
+    """
+    Estimate the number of hexagonal layers for a requested qubit count.
+    
+    Proof generators and QuantumSimulator share this estimate, so a requested
+    qubit count and difficulty always map to the same circuit.
+    
+    Args:
+        qubit_count: Number of qubits requested
+        difficulty_level: Additional layers on top of the estimate
+    
+    Returns:
+        The number of layers, at least 1
+    """
+    # Calculate layers based on qubit_count (approximate)
+    # From the formula: qubit_count = 1 + 3*(layers-1)*layers
+    # We'll approximate: layers ~ sqrt(qubit_count/3)
+    import math
+    return max(1, int(math.sqrt(qubit_count / 3)) + difficulty_level)
+
+
 if __name__ == "__main__":
     # Example usage
     print("Generating hexagonal quantum circuit...")
     
     # Create a circuit with 3 layers
-    circuit = HexagonalQuantumCircuit(layers=3, qubits_per_side=1)
+    circuit = HexagonalQuantumCircuit(layers=3)
     circuit.build_circuit()
     
     print(f"Circuit created with {circuit.qubit_count} qubits")
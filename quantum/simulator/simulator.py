@@ -8,14 +8,25 @@ available, allowing the network to continue operating with simulated quantum pro
 """
 
 import numpy as np
-import hashlib
 import json
-from hex_hadamard_cnot import HexagonalQuantumCircuit
+import functools
+from typing import Any, Dict
+from hex_hadamard_cnot import (
+    aer_backend,
+    bitstring_to_array,
+    build_transpiled,
+    circuit_template,
+    descriptor_bytes_from_json,
+    descriptor_hasher,
+    encode_measurement_results,
+    estimate_layers,
+    is_clifford_circuit,
+)
 
 # Import qiskit components with fallback
 try:
     from qiskit import QuantumCircuit, transpile
-    from qiskit_aer import AerSimulator, NoiseModel
+    from qiskit_aer import NoiseModel
     from qiskit_aer.noise import depolarizing_error
 except ImportError:
     try:
@@ -29,10 +40,38 @@ except ImportError:
             raise ImportError("Qiskit is not available")
 
         QuantumCircuit = stub_function
-        AerSimulator = stub_function
         NoiseModel = stub_function
         depolarizing_error = stub_function
 
+# Gates the Aer simulator executes natively, for which transpilation is a no-op
+NATIVE_GATES = {'h', 'cx', 'measure'}
+
+
+@functools.lru_cache(maxsize=8)
+def _noise_model_for(noise_level):
+    """
+    Create the noise model for a noise level, shared by all simulators using it.
+    
+    The returned NoiseModel is shared between QuantumSimulator instances and
+    must not be modified.
+    """
+    try:
+        # Try the newer qiskit_aer interface
+        noise_model = NoiseModel()
+
+        # Add depolarizing error to all single-qubit gates
+        error_1q = depolarizing_error(noise_level, 1)
+        noise_model.add_all_qubit_quantum_error(error_1q, ['u1', 'u2', 'u3'])
+
+        # Add depolarizing error to all two-qubit gates
+        error_2q = depolarizing_error(noise_level, 2)
+        noise_model.add_all_qubit_quantum_error(error_2q, ['cx'])
+    except:
+        # Fallback if noise model creation fails
+        noise_model = None
+
+    return noise_model
+
 
 class QuantumSimulator:
     """
@@ -47,57 +86,44 @@ class QuantumSimulator:
             noise_level: Level of noise to add to simulations (0.0 = no noise)
         """
         self.noise_level = noise_level
-        self.noise_model = self._create_noise_model()
+        self.noise_model = _noise_model_for(noise_level)
     
-    def _create_noise_model(self):
-        """
-        Create a noise model for the simulator.
-        """
-        try:
-            # Try the newer qiskit_aer interface
-            noise_model = NoiseModel()
-
-            # Add depolarizing error to all single-qubit gates
-            error_1q = depolarizing_error(self.noise_level, 1)
-            noise_model.add_all_qubit_quantum_error(error_1q, ['u1', 'u2', 'u3'])
-
-            # Add depolarizing error to all two-qubit gates
-            error_2q = depolarizing_error(self.noise_level, 2)
-            noise_model.add_all_qubit_quantum_error(error_2q, ['cx'])
-        except:
-            # Fallback if noise model creation fails
-            noise_model = None
-
-        return noise_model
-    
-    def simulate_circuit(self, circuit, shots=1024):
+    def simulate_circuit(self, circuit, shots=1024, transpiled=False):
         """
         Simulate a quantum circuit.
 
         Args:
             circuit: A Qiskit QuantumCircuit to simulate
             shots: Number of times to run the simulation
+            transpiled: Whether the circuit is already transpiled for the Aer backend
 
         Returns:
             A dictionary with simulation results
         """
-        # Try to use the newer qiskit interface
+        # Try to use the newer qiskit interface; aer_backend raises ImportError
+        # when qiskit_aer is not installed
         try:
-            from qiskit import transpile
-            from qiskit_aer import AerSimulator
+            # Clifford circuits scale polynomially on the stabilizer method,
+            # everything else needs the full statevector
+            method = 'stabilizer' if is_clifford_circuit(circuit) else 'statevector'
+            backend = aer_backend(method)
 
-            # Create the simulator with noise model
-            backend = AerSimulator()
+            run_options = {'shots': shots}
+            if method == 'statevector':
+                # Let Aer fuse runs of small gates into larger unitaries
+                run_options.update(fusion_enable=True, fusion_threshold=5)
 
-            # Transpile the circuit for the backend
-            transpiled_circuit = transpile(circuit, backend)
+            # Transpile the circuit for the backend unless it is already in native gates
+            if transpiled or set(circuit.count_ops()) <= NATIVE_GATES:
+                transpiled_circuit = circuit
+            else:
+                transpiled_circuit = transpile(circuit, backend, optimization_level=3)
 
             # Execute the circuit
             if self.noise_level > 0 and self.noise_model is not None:
                 # Apply noise model if needed
-                result = backend.run(transpiled_circuit, shots=shots, noise_model=self.noise_model).result()
-            else:
-                result = backend.run(transpiled_circuit, shots=shots).result()
+                run_options['noise_model'] = self.noise_model
+            result = backend.run(transpiled_circuit, **run_options).result()
 
             counts = result.get_counts(transpiled_circuit)
         except ImportError:
@@ -120,12 +146,13 @@ class QuantumSimulator:
         # Process the results
         total_counts = sum(counts.values())
         probabilities = {state: count/total_counts for state, count in counts.items()}
+        most_common = max(counts, key=counts.get)
 
         return {
             'counts': counts,
             'probabilities': probabilities,
-            'most_common': max(counts, key=counts.get),
-            'measurement_results': [int(bit) for bit in max(counts, key=counts.get)]
+            'most_common': most_common,
+            'measurement_results': bitstring_to_array(most_common)
         }
     
     def simulate_quantum_proof(self, qubit_count, difficulty_level=1):
@@ -140,31 +167,32 @@ class QuantumSimulator:
             A dictionary containing the simulated quantum proof components
         """
         # Calculate layers based on qubit_count
-        import math
-        estimated_layers = max(1, int(math.sqrt(qubit_count / 3)) + difficulty_level)
-        
-        # Create the hexagonal circuit
-        hex_circuit = HexagonalQuantumCircuit(layers=estimated_layers, qubits_per_side=1)
-        hex_circuit.build_circuit()
+        estimated_layers = estimate_layers(qubit_count, difficulty_level)
         
-        # Simulate the circuit
-        simulation_result = self.simulate_circuit(hex_circuit.circuit)
+        # Reuse the cached hexagonal circuit and its transpilation
+        circuit, circuit_descriptor, descriptor_bytes = circuit_template(estimated_layers)
+        try:
+            transpiled_circuit = build_transpiled(estimated_layers, 'stabilizer')
+            # A proof consumes a single sample, so one shot is enough
+            simulation_result = self.simulate_circuit(transpiled_circuit, shots=1, transpiled=True)
+        except ImportError:
+            simulation_result = self.simulate_circuit(circuit, shots=1)
         
         # Generate a proof artifact (hash of the circuit and results)
-        circuit_descriptor = hex_circuit.get_circuit_descriptor()
-        proof_input = circuit_descriptor + simulation_result['most_common']
-        proof_artifact = hashlib.sha256(proof_input.encode()).hexdigest()
+        hasher = descriptor_hasher(descriptor_bytes).copy()
+        hasher.update(simulation_result['most_common'].encode('ascii'))
+        proof_artifact = hasher.hexdigest()
         
         # Create the quantum proof
         quantum_proof = {
             'circuit_descriptor': circuit_descriptor,
             'measurement_results': simulation_result['measurement_results'],
             'proof_artifact': proof_artifact,
-            'qubit_count': hex_circuit.qubit_count,
+            'qubit_count': circuit.num_qubits,
             'timestamp': __import__('time').time(),
             'difficulty_level': difficulty_level,
             'simulation_metadata': {
-                'shots': 1024,
+                'shots': 1,
                 'noise_level': self.noise_level,
                 'backend': 'qasm_simulator'
             }
@@ -172,7 +200,7 @@ class QuantumSimulator:
         
         return quantum_proof
     
-    def verify_simulation(self, proof):
+    def verify_simulation(self, proof: Dict[str, Any]) -> bool:
         """
         Verify that a proof could have been generated by the simulator.
         
@@ -187,12 +215,21 @@ class QuantumSimulator:
         measurement_results = proof.get('measurement_results')
         proof_artifact = proof.get('proof_artifact')
         
-        if not all([circuit_descriptor, measurement_results, proof_artifact]):
+        if not circuit_descriptor or not proof_artifact:
+            return False
+        if measurement_results is None or len(measurement_results) == 0:
             return False
         
         # Verify the proof artifact matches the descriptor and results
-        expected_input = circuit_descriptor + ''.join(map(str, measurement_results))
-        expected_artifact = hashlib.sha256(expected_input.encode()).hexdigest()
+        try:
+            descriptor_bytes = descriptor_bytes_from_json(circuit_descriptor)
+            bitstring_bytes = encode_measurement_results(measurement_results)
+        except ValueError:
+            return False
+        
+        hasher = descriptor_hasher(descriptor_bytes).copy()
+        hasher.update(bitstring_bytes)
+        expected_artifact = hasher.hexdigest()
         
         if expected_artifact != proof_artifact:
             return False
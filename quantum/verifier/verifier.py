@@ -9,13 +9,24 @@ without requiring the verifier to perform the quantum computation itself.
 
 import hashlib
 import json
+import numpy as np
 import sys
 import os
+from typing import Any, Dict, List, Set, Union
 
 # Add the circuits directory to the path so we can import the hex_hadamard_cnot module
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'circuits'))
 
-from hex_hadamard_cnot import HexagonalQuantumCircuit, generate_quantum_proof
+from hex_hadamard_cnot import (
+    HexagonalQuantumCircuit,
+    descriptor_bytes_from_json,
+    descriptor_hasher,
+    encode_measurement_results,
+    generate_quantum_proof,
+)
+
+# A quantum proof as produced by generate_quantum_proof()
+Proof = Dict[str, Any]
 
 
 class QuantumProofVerifier:
@@ -23,10 +34,10 @@ class QuantumProofVerifier:
     Verifies quantum proofs generated by the hexagonal quantum circuits.
     """
 
-    def __init__(self):
-        self.valid_proofs = set()  # Keep track of verified proofs to prevent replay attacks
+    def __init__(self) -> None:
+        self.valid_proofs: Set[str] = set()  # Keep track of verified proofs to prevent replay attacks
 
-    def verify_proof(self, proof):
+    def verify_proof(self, proof: Proof) -> bool:
         """
         Verify a quantum proof.
 
@@ -75,18 +86,29 @@ class QuantumProofVerifier:
         self.valid_proofs.add(proof_hash)
         return True
 
-    def _verify_proof_artifact(self, proof):
+    def _verify_proof_artifact(self, proof: Proof) -> bool:
         """
         Verify that the proof artifact matches the circuit descriptor and measurement results.
         """
+        circuit_descriptor: str = proof['circuit_descriptor']
+        proof_artifact: str = proof['proof_artifact']
+
         # Reconstruct the proof artifact from the provided data
-        expected_input = proof['circuit_descriptor'] + ''.join(map(str, proof['measurement_results']))
-        expected_artifact = hashlib.sha256(expected_input.encode()).hexdigest()
+        try:
+            descriptor_bytes = descriptor_bytes_from_json(circuit_descriptor)
+            bitstring_bytes = encode_measurement_results(proof['measurement_results'])
+        except ValueError:
+            return False
+
+        hasher = descriptor_hasher(descriptor_bytes).copy()
+        hasher.update(bitstring_bytes)
 
-        # Compare with the provided proof artifact
-        return expected_artifact == proof['proof_artifact']
+        # Compare with the provided proof artifact. The hex strings are compared
+        # rather than decoded bytes, because bytes.fromhex() accepts uppercase and
+        # whitespace variants that would slip past replay detection
+        return hasher.hexdigest() == proof_artifact
 
-    def _verify_circuit_descriptor(self, descriptor_str):
+    def _verify_circuit_descriptor(self, descriptor_str: str) -> bool:
         """
         Verify that the circuit descriptor is properly formatted and valid.
         """
@@ -114,12 +136,12 @@ class QuantumProofVerifier:
             print("Invalid JSON in circuit descriptor")
             return False
 
-    def _verify_measurement_results(self, results, expected_qubit_count):
+    def _verify_measurement_results(self, results: Union[List[int], np.ndarray], expected_qubit_count: int) -> bool:
         """
         Verify that the measurement results are consistent with the qubit count.
         """
-        # Check that results is a list of 0s and 1s
-        if not isinstance(results, list):
+        # Check that results is a list or array of 0s and 1s
+        if not isinstance(results, (list, np.ndarray)):
             return False
 
         # Check that each result is a 0 or 1
@@ -134,7 +156,7 @@ class QuantumProofVerifier:
         return True
 
 
-def verify_quantum_challenge_solution(challenge, proof, validator_address):
+def verify_quantum_challenge_solution(challenge: Dict[str, Any], proof: Proof, validator_address: str) -> bool:
     """
     Verify a solution to a quantum challenge.
 
@@ -1,5 +1,6 @@
 # tests/quantum_tests.py
 import unittest
+import json
 import sys
 import os
 
@@ -7,14 +8,14 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'quantum', 'circuits'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'quantum', 'verifier'))
 
-from hex_hadamard_cnot import HexagonalQuantumCircuit, generate_quantum_proof
+from hex_hadamard_cnot import HexagonalQuantumCircuit, generate_quantum_proof, generate_quantum_proofs
 from verifier import QuantumProofVerifier
 
 
 class TestHexagonalQuantumCircuit(unittest.TestCase):
     def test_circuit_initialization(self):
         """Test that the hexagonal quantum circuit initializes correctly."""
-        circuit = HexagonalQuantumCircuit(layers=2, qubits_per_side=1)
+        circuit = HexagonalQuantumCircuit(layers=2)
         
         # Check that the qubit count is calculated correctly
         expected_qubit_count = 1 + 3 * (2 - 1) * 2  # 1 + 3*1*2 = 7
@@ -23,9 +24,30 @@ class TestHexagonalQuantumCircuit(unittest.TestCase):
         # Check that the circuit has the correct number of qubits
         self.assertEqual(circuit.circuit.num_qubits, expected_qubit_count)
     
+    def test_hex_structure_positions(self):
+        """Test that every qubit is assigned a position on the hexagonal lattice."""
+        circuit = HexagonalQuantumCircuit(layers=3)
+        positions = circuit.hex_structure['qubit_positions']
+
+        self.assertEqual(len(positions), circuit.qubit_count)
+        self.assertEqual(positions[0], (0, 0))
+        self.assertAlmostEqual(positions[1][0], 1.0)
+        self.assertAlmostEqual(positions[1][1], 0.0)
+    
+    def test_circuit_clone(self):
+        """Test that cloned circuits are equal but independent copies."""
+        circuit = HexagonalQuantumCircuit(layers=2)
+        circuit.build_circuit()
+
+        clone = circuit.clone()
+        self.assertEqual(clone, circuit.circuit)
+
+        clone.x(0)
+        self.assertNotEqual(clone, circuit.circuit)
+    
     def test_circuit_descriptor(self):
         """Test that the circuit descriptor is generated correctly."""
-        circuit = HexagonalQuantumCircuit(layers=2, qubits_per_side=1)
+        circuit = HexagonalQuantumCircuit(layers=2)
         descriptor = circuit.get_circuit_descriptor()
         
         # Check that the descriptor is a valid JSON string
@@ -43,9 +65,22 @@ class TestHexagonalQuantumCircuit(unittest.TestCase):
         self.assertEqual(parsed['qubit_count'], circuit.qubit_count)
         self.assertEqual(parsed['layers'], circuit.layers)
     
+    def test_descriptor_bytes_round_trip(self):
+        """Test that the hashed descriptor bytes can be rebuilt from the JSON descriptor."""
+        from hex_hadamard_cnot import descriptor_bytes_from_json
+
+        circuit = HexagonalQuantumCircuit(layers=3)
+        circuit.build_circuit()
+
+        rebuilt = descriptor_bytes_from_json(circuit.get_circuit_descriptor())
+        self.assertEqual(rebuilt, circuit._descriptor_bytes)
+
+        with self.assertRaises(ValueError):
+            descriptor_bytes_from_json('{"qubit_count": 5}')
+    
     def test_circuit_simulation(self):
         """Test that the circuit can be simulated."""
-        circuit = HexagonalQuantumCircuit(layers=2, qubits_per_side=1)
+        circuit = HexagonalQuantumCircuit(layers=2)
         circuit.build_circuit()
         
         result = circuit.simulate()
@@ -62,6 +97,26 @@ class TestHexagonalQuantumCircuit(unittest.TestCase):
         # Check that all measurement results are 0 or 1
         for bit in result['measurement_results']:
             self.assertIn(bit, [0, 1])
+
+    def test_simulation_reflects_circuit_changes(self):
+        """Test that gates added after build_circuit() are simulated and described."""
+        circuit = HexagonalQuantumCircuit(layers=2)
+        circuit.build_circuit()
+        circuit.circuit.x(0)
+
+        result = circuit.simulate()
+
+        self.assertEqual(result['circuit_descriptor'], circuit.get_circuit_descriptor())
+        self.assertEqual(json.loads(result['circuit_descriptor'])['gate_counts']['x'], 1)
+
+    def test_single_layer_simulation(self):
+        """Test that proofs on the uniform single-layer circuit are sampled without simulation."""
+        proofs = generate_quantum_proofs(qubit_count=1, n=3, difficulty_level=0)
+
+        for proof in proofs:
+            self.assertEqual(proof['qubit_count'], 1)
+            self.assertIn(proof['measurement_results'][0], [0, 1])
+            self.assertTrue(QuantumProofVerifier().verify_proof(proof))
     
     def test_generate_quantum_proof(self):
         """Test that quantum proofs can be generated."""
@@ -80,6 +135,33 @@ class TestHexagonalQuantumCircuit(unittest.TestCase):
         self.assertGreater(len(proof['proof_artifact']), 0)
         self.assertEqual(len(proof['measurement_results']), proof['qubit_count'])
 
+    def test_generate_quantum_proofs_batch(self):
+        """Test that a batch of proofs can be generated from a single simulation."""
+        proofs = generate_quantum_proofs(qubit_count=8, n=5, difficulty_level=1)
+
+        self.assertEqual(len(proofs), 5)
+        for proof in proofs:
+            self.assertEqual(len(proof['measurement_results']), proof['qubit_count'])
+            self.assertTrue(QuantumProofVerifier().verify_proof(proof))
+
+    def test_large_circuit_simulation(self):
+        """Test that circuits beyond statevector limits can still be simulated."""
+        proof = generate_quantum_proof(qubit_count=20, difficulty_level=2)
+
+        self.assertEqual(proof['qubit_count'], 37)
+        self.assertEqual(len(proof['measurement_results']), proof['qubit_count'])
+
+    def test_circuit_template_reuse(self):
+        """Test that repeated proofs reuse the cached circuit template."""
+        from hex_hadamard_cnot import circuit_template
+
+        first = generate_quantum_proof(qubit_count=8, difficulty_level=1)
+        hits = circuit_template.cache_info().hits
+        second = generate_quantum_proof(qubit_count=8, difficulty_level=1)
+
+        self.assertGreater(circuit_template.cache_info().hits, hits)
+        self.assertEqual(first['circuit_descriptor'], second['circuit_descriptor'])
+
 
 class TestQuantumProofVerifier(unittest.TestCase):
     def test_proof_verification(self):